@@ -90,6 +90,9 @@ NON_IMAGE_RASTER_MEDIA_TYPES = {
     "application/zarr",
 }
 
+# nodata values of these types are used as is, anything else is cast to float
+_NODATA_TYPES = frozenset([int, float])
+
 
 def _band_metadata_raw(asset: pystac.asset.Asset) -> List[RasterBand]:
     bands = asset.to_dict().get("raster:bands", None)
@@ -98,6 +101,12 @@ def _band_metadata_raw(asset: pystac.asset.Asset) -> List[RasterBand]:
     return [RasterBand(props) for props in bands]
 
 
+def _norm_nodata(nodata: Any) -> Union[float, None]:
+    if nodata is None or type(nodata) in _NODATA_TYPES:
+        return nodata
+    return float(nodata)
+
+
 def band_metadata(
     asset: pystac.asset.Asset, default: RasterBandMetadata
 ) -> List[RasterBandMetadata]:
@@ -119,13 +128,6 @@ def band_metadata(
     if len(bands) == 0:
         return [default]
 
-    def _norm_nodata(nodata) -> Union[float, None]:
-        if nodata is None:
-            return None
-        if isinstance(nodata, (int, float)):
-            return nodata
-        return float(nodata)
-
     return [
         RasterBandMetadata(
             with_default(band.data_type, default.data_type),
@@ -767,20 +769,31 @@ def _auto_load_params(
 
 def _normalize_geometry(xx: Any) -> Geometry:
     if isinstance(xx, shapely.geometry.base.BaseGeometry):
-        return Geometry(xx, "epsg:4326")
+        return Geometry(xx, EPSG4326)
 
     if isinstance(xx, Geometry):
         return xx
 
     if isinstance(xx, dict):
-        return Geometry(xx, "epsg:4326")
+        return Geometry(xx, EPSG4326)
 
     # GeoPandas
     _geo = getattr(xx, "__geo_interface__", None)
     if _geo is None:
         raise ValueError("Can't interpret value as geometry")
 
-    _crs = getattr(xx, "crs", "epsg:4326")
+    _crs = getattr(xx, "crs", EPSG4326)
+
+    # GeoDataFrame/GeoSeries already hold shapely objects, use them directly
+    # rather than going through GeoJSON
+    _geoms = getattr(xx, "geometry", None)
+    if _geoms is not None and hasattr(_geoms, "crs"):
+        _gg = [Geometry(g, _crs) for g in _geoms if g is not None]
+        if len(_gg) == 1:
+            return _gg[0]
+        if _gg:
+            return geom.multigeom(_gg)
+
     return Geometry(_geo, _crs)
 
 
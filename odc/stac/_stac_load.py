@@ -544,6 +544,13 @@ def _group_items(
 ) -> List[List[int]]:
     assert len(items) == len(parsed)
 
+    if not parsed:
+        return []
+
+    if groupby == "id":
+        # every item is its own group, in original order
+        return [[idx] for idx in range(len(parsed))]
+
     group_key = _resolve_groupby(groupby, lon=lon)
 
     def _sorter(idx: int):
@@ -7,7 +7,7 @@ from copy import copy
 from dataclasses import dataclass, field
 from time import sleep
 from timeit import default_timer as t_now
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
 
 import affine
 import distributed
@@ -383,15 +383,22 @@ def _default_nodata(dtype):
     return 0
 
 
-def load_from_json(geojson, params: BenchLoadParams, **kw):
+def load_from_json(
+    geojson: Union[Mapping[str, Any], Sequence[pystac.item.Item]],
+    params: BenchLoadParams,
+    **kw,
+):
     """
     Turn passed in geojson into a Dask array.
 
-    :param geojson: GeoJSON FeatureCollection
+    :param geojson: GeoJSON FeatureCollection, or already parsed STAC Items
     :param params: data loading configuration
     :param kw: passed on to underlying data load function
     """
-    all_items = [pystac.item.Item.from_dict(f) for f in geojson["features"]]
+    if isinstance(geojson, Mapping):
+        all_items = [pystac.item.Item.from_dict(f) for f in geojson["features"]]
+    else:
+        all_items = list(geojson)
 
     opts = params.compute_args()
     opts.update(**kw)
@@ -221,7 +221,10 @@ def mk_dataset(
     _shape = (len(time), *gbox.shape.yx)
     coords = xr_coords(gbox)
     crs_coord_name: Hashable = list(coords)[-1]
-    coords["time"] = xr.DataArray(time, dims=("time",))
+    # single conversion instead of xarray inferring type from datetime objects
+    coords["time"] = xr.DataArray(
+        np.array(time, dtype="datetime64[ns]"), dims=("time",)
+    )
     dims = ("time", *gbox.dimensions)
 
     def _alloc(shape: Tuple[int, ...], dtype: str, name: Hashable) -> Any:
@@ -9,12 +9,15 @@ import shutil
 import tempfile
 from collections.abc import Mapping, Sequence
 from contextlib import contextmanager
-from typing import Generator
+from typing import Generator, List
 
 import rasterio
 import xarray as xr
 from odc.geo.xr import ODCExtensionDa
 
+# directories created by write_files, removed at interpreter exit
+_TEMP_DIRS: List[str] = []
+
 
 @contextmanager
 def with_temp_tiff(data: xr.DataArray, **cog_opts) -> Generator[str, None, None]:
@@ -41,14 +44,16 @@ def write_files(file_dict):
     :return: Created temporary directory path
     """
     containing_dir = tempfile.mkdtemp(suffix="testrun")
+    if not _TEMP_DIRS:
+        atexit.register(_remove_temp_dirs)
+    _TEMP_DIRS.append(containing_dir)
     _write_files_to_dir(containing_dir, file_dict)
+    return pathlib.Path(containing_dir)
 
-    def remove_if_exists(path):
-        if os.path.exists(path):
-            shutil.rmtree(path)
 
-    atexit.register(remove_if_exists, containing_dir)
-    return pathlib.Path(containing_dir)
+def _remove_temp_dirs():
+    while _TEMP_DIRS:
+        shutil.rmtree(_TEMP_DIRS.pop(), ignore_errors=True)
 
 
 def _write_files_to_dir(directory_path, file_dict):
@@ -58,13 +63,16 @@ def _write_files_to_dir(directory_path, file_dict):
     for filename, contents in file_dict.items():
         path = os.path.join(directory_path, filename)
         if isinstance(contents, Mapping):
-            os.mkdir(path)
+            os.makedirs(path, exist_ok=True)
             _write_files_to_dir(path, contents)
+            continue
+
+        if isinstance(contents, str):
+            data = contents
+        elif isinstance(contents, Sequence):
+            data = "".join(contents)
         else:
-            with open(path, "w", encoding="utf8") as f:
-                if isinstance(contents, str):
-                    f.write(contents)
-                elif isinstance(contents, Sequence):
-                    f.writelines(contents)
-                else:
-                    raise ValueError(f"Unexpected file contents: {type(contents)}")
+            raise ValueError(f"Unexpected file contents: {type(contents)}")
+
+        with open(path, "w", encoding="utf8") as f:
+            f.write(data)
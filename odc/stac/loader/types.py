@@ -1,6 +1,8 @@
 """Metadata and data loading model classes."""
 
+import sys
 from dataclasses import astuple, dataclass
+from functools import lru_cache
 from typing import Any, ContextManager, Dict, Mapping, Optional, Protocol, Tuple, Union
 
 import numpy as np
@@ -122,11 +124,11 @@ class RasterLoadParams:
         if isinstance(src, RasterBandMetadata):
             meta = src
         else:
-            meta = src.meta or RasterBandMetadata()
+            meta = src.meta or BAND_DEFAULTS
 
         dtype = meta.data_type
         if dtype is None:
-            dtype = "float32"
+            dtype = BAND_DEFAULTS.data_type
 
         return RasterLoadParams(dtype=dtype, fill_value=meta.nodata)
 
@@ -160,14 +162,36 @@ class SomeReader(Protocol):
 BAND_DEFAULTS = RasterBandMetadata("float32", None, "1")
 
 
+def _intern(v: Any) -> Any:
+    # dtype/unit strings come from a small set of values
+    if type(v) is str:  # pylint: disable=unidiomatic-typecheck
+        return sys.intern(v)
+    return v
+
+
+@lru_cache(maxsize=1024, typed=True)
+def _cached_band_metadata(
+    data_type: Optional[str], nodata: Optional[float], unit: str
+) -> RasterBandMetadata:
+    return RasterBandMetadata(data_type, nodata, unit)
+
+
 def norm_band_metadata(
     v: Union[RasterBandMetadata, Dict[str, Any]],
     fallback: RasterBandMetadata = BAND_DEFAULTS,
 ) -> RasterBandMetadata:
     if isinstance(v, RasterBandMetadata):
         return v
-    return RasterBandMetadata(
-        v.get("data_type", fallback.data_type),
+    if len(v) == 0 and fallback.dims is None:
+        return fallback
+
+    args = (
+        _intern(v.get("data_type", fallback.data_type)),
         v.get("nodata", fallback.nodata),
-        v.get("unit", fallback.unit),
+        _intern(v.get("unit", fallback.unit)),
     )
+    try:
+        # share instances across identical configs
+        return _cached_band_metadata(*args)
+    except TypeError:  # unhashable config values
+        return RasterBandMetadata(*args)
@@ -3,7 +3,8 @@
 import datetime as dt
 import math
 from copy import copy
-from dataclasses import astuple, dataclass, field, replace
+from dataclasses import dataclass, field
+from operator import itemgetter
 from typing import (
     Any,
     Dict,
@@ -12,7 +13,6 @@ from typing import (
     Mapping,
     Optional,
     Sequence,
-    Set,
     Tuple,
     Union,
 )
@@ -96,7 +96,15 @@ class RasterCollectionMetadata(Mapping[Union[str, BandKey], RasterBandMetadata])
                 out.setdefault(cn, []).append(alias)
         return out
 
-    def _norm_key(self, k: BandKey) -> str:
+    def _first_aliases(self) -> Dict[BandKey, str]:
+        # band key -> first alias that references it as first choice
+        first_alias: Dict[BandKey, str] = {}
+        for alias, candidates in self.aliases.items():
+            if candidates:
+                first_alias.setdefault(candidates[0], alias)
+        return first_alias
+
+    def _compute_norm_key(self, k: BandKey, first_alias: Dict[BandKey, str]) -> str:
         asset, idx = k
 
         # if single band asset it's just asset name
@@ -104,16 +112,21 @@ class RasterCollectionMetadata(Mapping[Union[str, BandKey], RasterBandMetadata])
             return asset
 
         # if any alias references this key as first choice return that
-        for alias, (_k, *_) in self.aliases.items():
-            if _k == k:
-                return alias
+        alias = first_alias.get(k, None)
+        if alias is not None:
+            return alias
 
         # Finaly use . notation
         return f"{asset}.{idx}"
 
+    def _norm_key(self, k: BandKey) -> str:
+        return self._compute_norm_key(k, self._first_aliases())
+
     @property
     def all_bands(self) -> List[str]:
-        return [self._norm_key(k) for k in self.bands]
+        # one pass over aliases rather than one per band
+        first_alias = self._first_aliases()
+        return [self._compute_norm_key(k, first_alias) for k in self.bands]
 
     def normalize_band_query(self, bands: BandQuery = None) -> List[str]:
         if isinstance(bands, str):
@@ -142,11 +155,8 @@ class RasterCollectionMetadata(Mapping[Union[str, BandKey], RasterBandMetadata])
             return (band, 1)
 
         candidates = self.aliases.get(band, [])
-        n = len(candidates)
-        if n == 1:
-            return candidates[0]
-        if n > 1:
-            # maybe warn about ambiguity?
+        if candidates:
+            # maybe warn about ambiguity when more than one?
             return candidates[0]
 
         # check if it's asset.<index> form
@@ -183,11 +193,16 @@ class RasterCollectionMetadata(Mapping[Union[str, BandKey], RasterBandMetadata])
         if isinstance(__o, tuple):
             return __o in self.bands
         if isinstance(__o, str):
-            return __o in self.aliases or norm_key(__o) in self.bands
+            if __o in self.aliases:
+                return True
+            try:
+                return norm_key(__o) in self.bands
+            except ValueError:
+                return False
         return False
 
     def __dask_tokenize__(self):
-        return astuple(self)
+        return (self.name, self.bands, self.aliases, self.has_proj, self.band2grid)
 
 
 @dataclass(eq=True, frozen=True)
@@ -198,6 +213,8 @@ class ParsedItem(Mapping[Union[BandKey, str], RasterSource]):
     Only includes raster bands of interest.
     """
 
+    # pylint: disable=too-many-instance-attributes
+
     id: str
     """Item id copied from STAC."""
 
@@ -219,25 +236,59 @@ class ParsedItem(Mapping[Union[BandKey, str], RasterSource]):
     href: Optional[str] = None
     """Self link from stac item."""
 
+    _cache: Dict[Any, Any] = field(
+        init=False, repr=False, compare=False, default_factory=dict
+    )
+
+    _hash: int = field(init=False, repr=False, compare=False, default=0)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_hash", hash((self.id, self.collection.name)))
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # string hashes are process specific, recompute on load
+        return {**self.__dict__, "_cache": {}, "_hash": 0}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.__post_init__()
+
     def geoboxes(self, bands: BandQuery = None) -> Tuple[GeoBox, ...]:
         """
         Unique ``GeoBox`` s, highest resolution first.
 
         :param bands: which bands to consider, default is all
         """
-        bands = self.collection.normalize_band_query(bands)
+        bands = tuple(self.collection.normalize_band_query(bands))
+        cache = self._cache
+        cache_key = ("geoboxes", bands)
+        gbx = cache.get(cache_key, None)
+        if gbx is not None:
+            return gbx
 
         def _resolution(g: GeoBox) -> float:
             return min(g.resolution.map(abs).xy)  # type: ignore
 
-        gbx: Set[GeoBox] = set()
+        # bands sharing a grid usually share the same GeoBox object,
+        # so de-duplicate by identity before hashing GeoBoxes
+        seen: Dict[int, GeoBox] = {}
         for name in bands:
             b = self.bands.get(self.collection.band_key(name), None)
-            if b is not None:
-                if b.geobox is not None:
-                    gbx.add(b.geobox)
-
-        return tuple(sorted(gbx, key=_resolution))
+            if b is not None and b.geobox is not None:
+                seen.setdefault(id(b.geobox), b.geobox)
+
+        gbx = tuple(seen.values())
+        if len(gbx) == 2:
+            g1, g2 = gbx[0], gbx[1]
+            if g1 == g2:
+                gbx = (g1,)
+            elif _resolution(g2) < _resolution(g1):
+                gbx = (g2, g1)
+        elif len(gbx) > 2:
+            gbx = tuple(sorted(dict.fromkeys(gbx), key=_resolution))
+
+        cache[cache_key] = gbx
+        return gbx
 
     def crs(self, bands: BandQuery = None) -> Optional[CRS]:
         """
@@ -260,13 +311,28 @@ class ParsedItem(Mapping[Union[BandKey, str], RasterSource]):
         if isinstance(crs, Unset):
             crs = None
 
+        cache_key: Any = None
+        if isinstance(crs, (str, int, CRS)) or crs is None:
+            cache_key = (
+                "image_geometry",
+                crs,
+                tuple(self.collection.normalize_band_query(bands)),
+            )
+            if cache_key in self._cache:
+                return self._cache[cache_key]
+
+        geom: Optional[Geometry] = None
         for gbox in self.geoboxes(bands):
             if gbox.crs is not None:
                 if crs is None or crs == gbox.crs:
-                    return gbox.extent
-                return gbox.footprint(crs)
+                    geom = gbox.extent
+                else:
+                    geom = gbox.footprint(crs)
+                break
 
-        return None
+        if cache_key is not None:
+            self._cache[cache_key] = geom
+        return geom
 
     def safe_geometry(
         self,
@@ -370,10 +436,18 @@ class ParsedItem(Mapping[Union[BandKey, str], RasterSource]):
         """
         Nominal datetime adjusted by longitude.
         """
+        solar_date = self._cache.get("solar_date", None)
+        if solar_date is not None:
+            return solar_date
+
         lon = self.mid_longitude
         if lon is None:
-            return self.nominal_datetime
-        return _convert_to_solar_time(self.nominal_datetime, lon)
+            solar_date = self.nominal_datetime
+        else:
+            solar_date = _convert_to_solar_time(self.nominal_datetime, lon)
+
+        self._cache["solar_date"] = solar_date
+        return solar_date
 
     def solar_date_at(self, lon: float) -> dt.datetime:
         """
@@ -385,7 +459,15 @@ class ParsedItem(Mapping[Union[BandKey, str], RasterSource]):
         """
         Copy of self but with stripped bands.
         """
-        return replace(self, bands={k: band.strip() for k, band in self.bands.items()})
+        return ParsedItem(
+            self.id,
+            self.collection,
+            {k: band.strip() for k, band in self.bands.items()},
+            self.geometry,
+            self.datetime,
+            self.datetime_range,
+            self.href,
+        )
 
     def assets(self) -> Dict[str, List[RasterSource]]:
         """
@@ -395,13 +477,16 @@ class ParsedItem(Mapping[Union[BandKey, str], RasterSource]):
         for (asset, idx), src in self.bands.items():
             assets.setdefault(asset, []).append((idx, src))
 
-        return {
-            k: [src for _, src in sorted(srcs, key=lambda x: x[0])]
-            for k, srcs in assets.items()
-        }
+        def _sorted(srcs: List[Tuple[int, RasterSource]]) -> List[RasterSource]:
+            # most assets are single band
+            if len(srcs) == 1:
+                return [srcs[0][1]]
+            return [src for _, src in sorted(srcs, key=itemgetter(0))]
+
+        return {k: _sorted(srcs) for k, srcs in assets.items()}
 
     def __hash__(self) -> int:
-        return hash((self.id, self.collection.name))
+        return self._hash
 
     def __dask_tokenize__(self):
         return (
@@ -452,10 +537,16 @@ def _norm_band_cfg(
 
 
 def _convert_to_solar_time(utc: dt.datetime, longitude: float) -> dt.datetime:
-    # offset_seconds snapped to 1 hour increments
+    # offset snapped to 1 hour increments, rounding towards zero
     #    1/15 == 24/360 (hours per degree of longitude)
-    offset_seconds = int(longitude / 15) * 3600
-    return utc + dt.timedelta(seconds=offset_seconds)
+    if longitude >= 0:
+        offset_hours = int(longitude) // 15
+    else:
+        offset_hours = -(int(-longitude) // 15)
+
+    if offset_hours == 0:
+        return utc
+    return utc + dt.timedelta(hours=offset_hours)
 
 
 def norm_key(k: Union[str, BandKey]) -> BandKey:
@@ -2,22 +2,21 @@
 Making STAC items for testing.
 """
 
+import re
 from datetime import datetime, timezone
 
 import pystac.asset
 import pystac.item
-import xarray as xr
 from odc.geo.geobox import GeoBox
 from pystac.extensions.projection import ProjectionExtension
 from pystac.extensions.raster import RasterBand, RasterExtension
-from toolz import dicttoolz
 
 from .._mdtools import _group_geoboxes
 from ..model import (
     ParsedItem,
-    RasterBandMetadata,
     RasterCollectionMetadata,
     RasterSource,
+    norm_band_metadata,
     norm_key,
 )
 
@@ -27,17 +26,31 @@ STAC_DATE_FMT = "%Y-%m-%dT%H:%M:%S.%fZ"
 STAC_DATE_FMT_SHORT = "%Y-%m-%dT%H:%M:%SZ"
 
 
+# Python < 3.11 only parses 3 or 6 digits of fractional seconds
+_FRAC_RGX = re.compile(r"\.(\d+)")
+
+
+def _norm_date(dt):
+    if isinstance(dt, str):
+        if dt.endswith(("Z", "z")):
+            dt = dt[:-1] + "+00:00"
+        dt = _FRAC_RGX.sub(lambda m: "." + m.group(1)[:6].ljust(6, "0"), dt, 1)
+        dt = datetime.fromisoformat(dt)
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
 def _norm_dates(*args):
-    valid = [a for a in args if a is not None]
-    valid = [
-        datetime.fromisoformat(dt).replace(tzinfo=timezone.utc)
-        for dt in xr.DataArray(list(valid))
-        .astype("datetime64[ns]")
-        .dt.strftime("%Y-%m-%dT%H:%M:%S.%f")
-        .values
-    ]
-    valid = iter(valid)
-    return [next(valid) if a else None for a in args]
+    return [_norm_date(a) if a else None for a in args]
+
+
+def _fmt_stac_date(dt: datetime) -> str:
+    # Same as dt.strftime(STAC_DATE_FMT), without re-parsing the format string
+    return (
+        f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+        f"T{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}.{dt.microsecond:06d}Z"
+    )
 
 
 def b_(
@@ -54,7 +67,8 @@ def b_(
     name, _ = band_key
     if uri is None:
         uri = f"{prefix}{name}.tif"
-    meta = RasterBandMetadata(dtype, nodata, unit)
+    # identical (dtype, nodata, unit) share one metadata instance
+    meta = norm_band_metadata({"data_type": dtype, "nodata": nodata, "unit": unit})
     return (band_key, RasterSource(uri, bidx, geobox=geobox, meta=meta))
 
 
@@ -74,9 +88,7 @@ def mk_parsed_item(
     if isinstance(bands, (list, tuple)):
         bands = {norm_key(k): v for k, v in bands}
 
-    gboxes = dicttoolz.valmap(lambda b: b.geobox, bands)
-    gboxes = dicttoolz.valfilter(lambda x: x is not None, gboxes)
-    gboxes = dicttoolz.keymap(lambda bk: bk[0], gboxes)
+    gboxes = {bk[0]: b.geobox for bk, b in bands.items() if b.geobox is not None}
 
     if len(gboxes) == 0:
         band2grid = {b: "default" for b, _ in bands}
@@ -92,7 +104,7 @@ def mk_parsed_item(
 
     collection = RasterCollectionMetadata(
         collection,
-        dicttoolz.valmap(lambda b: b.meta, bands),
+        {bk: b.meta for bk, b in bands.items()},
         aliases={},
         has_proj=(geobox is not None),
         band2grid=band2grid,
@@ -131,7 +143,7 @@ def to_stac_item(item: ParsedItem) -> pystac.item.Item:
     props = {}
     for n, dt in zip(["start_datetime", "end_datetime"], item.datetime_range):
         if dt is not None:
-            props[n] = dt.strftime(STAC_DATE_FMT)
+            props[n] = _fmt_stac_date(dt)
 
     xx = pystac.item.Item(
         item.id,
@@ -161,18 +173,11 @@ def to_stac_item(item: ParsedItem) -> pystac.item.Item:
 
     for asset_name, bands in item.assets().items():
         b = bands[0]  # all bands shoudl share same uri
-        xx.add_asset(
-            asset_name,
-            pystac.asset.Asset(b.uri, media_type="image/tiff", roles=["data"]),
-        )
-        RasterExtension.ext(xx.assets[asset_name]).apply(
-            list(map(_to_raster_band, bands))
-        )
-
-    for asset_name, asset in xx.assets.items():
-        bb = item.bands[(asset_name, 1)]
-        if bb.geobox is not None:
-            _add_proj(bb.geobox, asset)
+        asset = pystac.asset.Asset(b.uri, media_type="image/tiff", roles=["data"])
+        xx.add_asset(asset_name, asset)
+        RasterExtension.ext(asset).apply(list(map(_to_raster_band, bands)))
+        if b.geobox is not None:
+            _add_proj(b.geobox, asset)
 
     if item.href is not None:
         xx.set_self_href(item.href)
@@ -4,16 +4,15 @@ import os.path
 
 def compute(folder: str) -> str:
     hash = hashlib.sha256()
-    paths = [
-        os.path.join(folder, file_name)
-        for file_name in os.listdir(folder)
-        if os.path.splitext(file_name)[1] == ".py"
-    ]
-    paths = sorted(paths, key=str.casefold)
+    with os.scandir(folder) as it:
+        paths = sorted(
+            (e.path for e in it if e.name.endswith(".py") and e.is_file()),
+            key=str.casefold,
+        )
     for path in paths:
         with open(path, "rb") as file:
-            bytes = file.read()
-            hash.update(bytes)
+            for chunk in iter(lambda: file.read(1 << 20), b""):
+                hash.update(chunk)
     return hash.hexdigest(), paths
 
 
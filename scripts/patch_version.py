@@ -1,39 +1,40 @@
+import os
 import re
 import sys
 
-from packaging import version
+version_rgx = re.compile(
+    r"^[ \t]*__version__[ \t]*=[ \t]*['\"]([^'\"\n]*)['\"]", re.ASCII | re.MULTILINE
+)
 
-version_rgx = re.compile("^\\s*__version__\\s*=\\s*['\"]([^'\"]*)['\"]")
-
-
-def match_version(line):
-    mm = version_rgx.match(line)
-    if mm is None:
-        return None
-    (version_str,) = mm.groups()
-    return version_str
+# release segment of a PEP 440 version: [v]N(.N)*
+release_rgx = re.compile(r"v?(\d+(?:\.\d+)*)", re.ASCII | re.IGNORECASE)
 
 
 def mk_dev_version(v, build_number):
-    *fixed, last = version.parse(v).release
+    mm = release_rgx.match(v.strip())
+    if mm is None:
+        raise ValueError(f"Invalid version: {v!r}")
+    *fixed, last = map(int, mm.group(1).split("."))
     next_version = (*fixed, f"{last+1:d}-dev{build_number:d}")
     return ".".join(map(str, next_version))
 
 
-def patch_version_lines(lines, build_number):
-    for line in lines:
-        v_prev = match_version(line)
-        if v_prev is not None:
-            v_next = mk_dev_version(v_prev, build_number)
-            line = line.replace(v_prev, v_next)
-        yield line
+def patch_version_text(text, build_number):
+    def _patch(mm):
+        v_prev = mm.group(1)
+        return mm.group(0).replace(v_prev, mk_dev_version(v_prev, build_number))
+
+    return version_rgx.sub(_patch, text)
 
 
 def patch_file(fname, build_number):
     with open(fname) as src:
-        lines = list(patch_version_lines(src, build_number))
-    with open(fname, "wt") as dst:
-        dst.writelines(lines)
+        text = patch_version_text(src.read(), build_number)
+
+    tmp_fname = fname + ".tmp"
+    with open(tmp_fname, "wt") as dst:
+        dst.write(text)
+    os.replace(tmp_fname, fname)
 
 
 if __name__ == "__main__":
@@ -1,34 +1,40 @@
+from types import MappingProxyType
+
 from pystac import Item
+from pystac.utils import str_to_datetime
 
 from odc.stac._mdtools import RasterBandMetadata
 
 # fmt: off
-S2_ALL_BANDS = {
+S2_ALL_BANDS = frozenset({
     "B01", "B02", "B03", "B04", "B05", "B06",
     "B07", "B08", "B09", "B11", "B12", "B8A",
     "AOT", "SCL", "WVP", "visual",
-}
+})
 # fmt: on
 
 
-STAC_CFG = {
-    "sentinel-2-l2a": {
-        "assets": {
-            "*": RasterBandMetadata("uint16", 0, "1"),
-            "SCL": RasterBandMetadata("uint8", 0, "1"),
-            "visual": dict(data_type="uint8", nodata=0, unit="1"),
-        },
-        "aliases": {
-            # Work around duplicate rededge common_name
-            # by defining custom unique aliases
-            "rededge1": "B05",
-            "rededge2": "B06",
-            "rededge3": "B07",
-        },
+# read-only at the top level so tests can't modify shared configs
+STAC_CFG = MappingProxyType(
+    {
+        "sentinel-2-l2a": {
+            "assets": {
+                "*": RasterBandMetadata("uint16", 0, "1"),
+                "SCL": RasterBandMetadata("uint8", 0, "1"),
+                "visual": dict(data_type="uint8", nodata=0, unit="1"),
+            },
+            "aliases": {
+                # Work around duplicate rededge common_name
+                # by defining custom unique aliases
+                "rededge1": "B05",
+                "rededge2": "B06",
+                "rededge3": "B07",
+            },
+        }
     }
-}
+)
 
-NO_WARN_CFG = {"*": {"warnings": "ignore"}}
+NO_WARN_CFG = MappingProxyType({"*": {"warnings": "ignore"}})
 
 
 def mk_stac_item(
@@ -37,18 +43,13 @@ def mk_stac_item(
     if stac_extensions is None:
         stac_extensions = []
 
-    return Item.from_dict(
-        {
-            "type": "Feature",
-            "stac_version": "1.0.0",
-            "id": str(_id),
-            "properties": {
-                "datetime": datetime,
-                **props,
-            },
-            "geometry": geometry,
-            "links": [],
-            "assets": {},
-            "stac_extensions": stac_extensions,
-        }
+    # construct directly rather than via Item.from_dict, which copies
+    # and migrates the whole document first
+    return Item(
+        str(_id),
+        geometry=geometry,
+        bbox=None,
+        datetime=str_to_datetime(datetime) if datetime is not None else None,
+        properties=dict(props),
+        stac_extensions=list(stac_extensions),
     )
@@ -3,7 +3,9 @@ Test for SQS to DC tool
 """
 
 import json
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from unittest.mock import MagicMock
 
 import distributed
@@ -12,6 +14,7 @@ import pystac
 import pystac.collection
 import pystac.item
 import pytest
+import shapely.geometry
 
 TEST_DATA_FOLDER: Path = Path(__file__).parent.joinpath("data")
 PARTIAL_PROJ_STAC: str = "only_crs_proj.json"
@@ -32,96 +35,111 @@ BENCH_SITE2: str = "site2-2020_jun_jul-35MNM.geojson"
 # pylint: disable=redefined-outer-name
 
 
+# Items are parsed once and shared between tests, use .clone() before
+# modifying them.
+@lru_cache(maxsize=None)
+def _load_item(name: str) -> pystac.item.Item:
+    return pystac.item.Item.from_file(str(TEST_DATA_FOLDER.joinpath(name)))
+
+
+# bench site FeatureCollections with links removed, shared read-only
+@lru_cache(maxsize=None)
+def _load_site(name: str):
+    gjson = json.loads(TEST_DATA_FOLDER.joinpath(name).read_bytes())
+    for item in gjson["features"]:
+        item["links"] = []
+    return gjson
+
+
 @pytest.fixture(scope="session")
 def test_data_dir():
     return TEST_DATA_FOLDER
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def partial_proj_stac():
-    return pystac.item.Item.from_file(str(TEST_DATA_FOLDER.joinpath(PARTIAL_PROJ_STAC)))
+    return _load_item(PARTIAL_PROJ_STAC)
 
 
 @pytest.fixture
 def no_bands_stac(partial_proj_stac):
-    partial_proj_stac.assets.clear()
-    return partial_proj_stac
+    item = partial_proj_stac.clone()
+    item.assets.clear()
+    return item
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def usgs_landsat_stac_v1():
-    return pystac.item.Item.from_file(
-        str(TEST_DATA_FOLDER.joinpath(USGS_LANDSAT_STAC_v1))
-    )
+    return _load_item(USGS_LANDSAT_STAC_v1)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def usgs_landsat_stac_v1b():
-    return pystac.item.Item.from_file(
-        str(TEST_DATA_FOLDER.joinpath(USGS_LANDSAT_STAC_v1b))
-    )
+    return _load_item(USGS_LANDSAT_STAC_v1b)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def usgs_landsat_stac_v1_1_1():
-    return pystac.item.Item.from_file(
-        str(TEST_DATA_FOLDER.joinpath(USGS_LANDSAT_STAC_v1_1_1))
-    )
+    return _load_item(USGS_LANDSAT_STAC_v1_1_1)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def ga_landsat_stac():
-    return pystac.item.Item.from_file(str(TEST_DATA_FOLDER.joinpath(GA_LANDSAT_STAC)))
+    return _load_item(GA_LANDSAT_STAC)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def lidar_stac():
-    return pystac.item.Item.from_file(str(TEST_DATA_FOLDER.joinpath(LIDAR_STAC)))
+    return _load_item(LIDAR_STAC)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sentinel_stac():
-    return pystac.item.Item.from_file(str(TEST_DATA_FOLDER.joinpath(SENTINEL_STAC)))
+    return _load_item(SENTINEL_STAC)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sentinel_stac_ms_json():
-    with TEST_DATA_FOLDER.joinpath(SENTINEL_STAC_MS).open("r", encoding="utf") as f:
-        return json.load(f)
+    return json.loads(TEST_DATA_FOLDER.joinpath(SENTINEL_STAC_MS).read_bytes())
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def bench_site1():
-    with TEST_DATA_FOLDER.joinpath(BENCH_SITE1).open("r", encoding="utf") as f:
-        return _strip_links(json.load(f))
+    return _load_site(BENCH_SITE1)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def bench_site2():
-    with TEST_DATA_FOLDER.joinpath(BENCH_SITE2).open("r", encoding="utf") as f:
-        return _strip_links(json.load(f))
+    return _load_site(BENCH_SITE2)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def bench_site1_items(bench_site1):
+    return [pystac.item.Item.from_dict(f) for f in bench_site1["features"]]
+
+
+@pytest.fixture(scope="session")
+def bench_site2_items(bench_site2):
+    return [pystac.item.Item.from_dict(f) for f in bench_site2["features"]]
+
+
+@pytest.fixture(scope="session")
 def sentinel_stac_ms():
-    return pystac.item.Item.from_file(str(TEST_DATA_FOLDER.joinpath(SENTINEL_STAC_MS)))
+    return _load_item(SENTINEL_STAC_MS)
 
 
 @pytest.fixture
 def sentinel_stac_ms_no_ext(sentinel_stac_ms_json):
-    metadata = dict(sentinel_stac_ms_json)
-    metadata["stac_extensions"] = []
-    return pystac.item.Item.from_dict(metadata)
+    # from_dict copies its input, so nested parts of the shared json are safe
+    return pystac.item.Item.from_dict({**sentinel_stac_ms_json, "stac_extensions": []})
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sentinel_stac_ms_with_raster_ext():
-    return pystac.item.Item.from_file(
-        str(TEST_DATA_FOLDER.joinpath(SENTINEL_STAC_MS_RASTER_EXT))
-    )
+    return _load_item(SENTINEL_STAC_MS_RASTER_EXT)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sentinel_stac_collection():
     return pystac.collection.Collection.from_file(
         str(TEST_DATA_FOLDER.joinpath(SENTINEL_STAC_COLLECTION))
@@ -130,10 +148,10 @@ def sentinel_stac_collection():
 
 @pytest.fixture
 def sentinel_odc():
-    return pystac.item.Item.from_file(str(TEST_DATA_FOLDER.joinpath(SENTINEL_ODC)))
+    return _load_item(SENTINEL_ODC).clone()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def relative_href_only(ga_landsat_stac: pystac.item.Item):
     item = pystac.Item.from_dict(ga_landsat_stac.to_dict())
     item = item.make_asset_hrefs_relative()
@@ -170,10 +188,9 @@ def sample_geojson():
     }
 
 
-@pytest.fixture
-def fake_dask_client(monkeypatch):
-    cc = MagicMock()
-    cc.scheduler_info.return_value = {
+# read-only at the top level, collect_context_info takes a .copy() of it
+_FAKE_SCHEDULER_INFO = MappingProxyType(
+    {
         "type": "Scheduler",
         "id": "Scheduler-80d943db-16f6-4476-a51a-64d57a287e9b",
         "address": "inproc://10.10.10.10/1281505/1",
@@ -211,32 +228,56 @@ def fake_dask_client(monkeypatch):
             }
         },
     }
+)
+
+
+@pytest.fixture(scope="session")
+def _fake_dask_client_mock():
+    cc = MagicMock()
+    cc.scheduler_info.return_value = _FAKE_SCHEDULER_INFO
     cc.cancel.return_value = None
     cc.restart.return_value = cc
     cc.persist = lambda x: x
     cc.compute = lambda x: x
+    return cc
+
 
+@pytest.fixture
+def fake_dask_client(monkeypatch, _fake_dask_client_mock):
     monkeypatch.setattr(distributed, "wait", MagicMock())
-    yield cc
+    yield _fake_dask_client_mock
 
 
-def _strip_links(gjson):
-    for item in gjson["features"]:
-        item["links"] = []
-    return gjson
-
+@pytest.fixture(scope="session")
+def gpd_countries():
+    """
+    Synthetic country table: one row, Australia as a lon/lat bounding box.
+
+    Not real country outlines, only the ``iso_a3`` column and a polygon per
+    country are provided.
+    """
+    yield gpd.GeoDataFrame(
+        {
+            "name": ["Australia"],
+            "iso_a3": ["AUS"],
+            "geometry": [shapely.geometry.box(112.9, -43.6, 153.6, -10.7)],
+        },
+        crs="epsg:4326",
+    )
 
-@pytest.fixture()
-def gpd_natural_earth():
-    yield gpd.read_file(gpd.datasets.get_path("naturalearth_lowres"))
 
+@pytest.fixture(scope="session")
+def gpd_country(gpd_countries):
+    # results are shared between tests, .copy() before modifying
+    cache = {}
 
-@pytest.fixture()
-def gpd_iso3(gpd_natural_earth):
     def _get(iso3, crs=None):
-        gg = gpd_natural_earth[gpd_natural_earth.iso_a3 == iso3]
-        if crs is not None:
-            gg = gg.to_crs(crs)
+        gg = cache.get((iso3, crs))
+        if gg is None:
+            gg = gpd_countries[gpd_countries.iso_a3 == iso3]
+            if crs is not None:
+                gg = gg.to_crs(crs)
+            cache[(iso3, crs)] = gg
         return gg
 
     yield _get
@@ -15,6 +15,7 @@
 
 # %%
 import json
+from pathlib import Path
 from timeit import default_timer as t_now
 
 import geopandas as gpd
@@ -47,26 +48,29 @@ elif mode == "site2":
     }
 
 
-cat = pystac_client.Client.open("https://planetarycomputer.microsoft.com/api/stac/v1")
-search = cat.search(
-    collections=["sentinel-2-l2a"],
-    datetime=datetime,
-    query=query,
-    bbox=bbox,
-)
-print("Query API end-point")
-all_features = search.get_all_items_as_dict()
-
-all_features["properties"] = dict(url=search.url, query=search._parameters)
-all_features["properties"]
-
-# %%
+# Re-use results of a previous query when available
 out_path = Path(f"{file_id}.geojson")
 if out_path.exists():
-    print(f"File exists, keeping previous version: {out_path}")
+    print(f"Loading previous query results: {out_path}")
+    all_features = json.loads(out_path.read_bytes())
 else:
+    cat = pystac_client.Client.open(
+        "https://planetarycomputer.microsoft.com/api/stac/v1"
+    )
+    search = cat.search(
+        collections=["sentinel-2-l2a"],
+        datetime=datetime,
+        query=query,
+        bbox=bbox,
+    )
+    print("Query API end-point")
+    all_features = search.get_all_items_as_dict()
+    all_features["properties"] = dict(url=search.url, query=search._parameters)
+
     print(f"Writing to: {out_path}")
-    json.dump(all_features, open(out_path, "wt"))
+    out_path.write_text(json.dumps(all_features), encoding="utf8")
+
+all_features["properties"]
 
 # %%
 all_items = [pystac.item.Item.from_dict(f) for f in all_features["features"]]
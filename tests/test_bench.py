@@ -1,6 +1,8 @@
+import importlib.util
+from types import MappingProxyType
+
 import pytest
 import xarray
-from distributed import Client
 from odc.geo.xr import ODCExtension
 
 from odc.stac.bench import (
@@ -20,23 +22,25 @@ CFG = {
 
 
 @pytest.fixture(scope="module")
-def dask_client():
-    client = Client(
-        n_workers=1,
-        threads_per_worker=2,
-        memory_limit="500MiB",
-        local_directory="/tmp/",
-        memory_target_fraction=False,
-        memory_spill_fraction=False,
-        memory_pause_fraction=False,
-        dashboard_address=None,
-        processes=False,
-    )
-    yield client
-    client.shutdown()
-    del client
+def load_site(bench_site1_items, bench_site2_items):
+    """Load a bench site, sharing results across tests with identical params."""
+    sites = {"site1": bench_site1_items, "site2": bench_site2_items}
+    cache = {}
+
+    def _load(site: str, params: BenchLoadParams):
+        key = (site, params.to_json())
+        xx = cache.get(key)
+        if xx is None:
+            xx = cache[key] = load_from_json(sites[site], params)
+        return xx
 
+    return _load
 
+
+# skip marks are evaluated before fixtures are set up
+@pytest.mark.skipif(
+    importlib.util.find_spec("stackstac") is None, reason="stackstac is not installed"
+)
 def test_load_from_json_stackstac(fake_dask_client, bench_site1, bench_site2):
     dask_client = fake_dask_client
     params = BenchLoadParams(
@@ -80,7 +84,7 @@ def test_load_from_json_stackstac(fake_dask_client, bench_site1, bench_site2):
         load_from_json(bench_site1, params.with_method("wroNg"))
 
 
-def test_bench_context(fake_dask_client, bench_site1, bench_site2):
+def test_bench_context(fake_dask_client, load_site):
     params = BenchLoadParams(
         scenario="test1",
         method="odc-stac",
@@ -88,7 +92,7 @@ def test_bench_context(fake_dask_client, bench_site1, bench_site2):
         chunks=(2048, 2048),
         extra={"odc-stac": {"groupby": "solar_day", "stac_cfg": CFG}},
     )
-    xx = load_from_json(bench_site1, params)
+    xx = load_site("site1", params)
     nt, ny, nx = xx.red.shape
     nb = len(xx.data_vars)
 
@@ -154,7 +158,7 @@ def test_bench_context(fake_dask_client, bench_site1, bench_site2):
         collect_context_info(fake_dask_client, "wrong input type")  # type: ignore
 
     # Check multi-time axis
-    xx = load_from_json(bench_site2, params)
+    xx = load_site("site2", params)
     nt, ny, nx = xx.red.shape
     nb = len(xx.data_vars)
 
@@ -195,7 +199,7 @@ def _strip_geo(xx: xarray.DataArray) -> xarray.DataArray:
     return no_geo
 
 
-def test_run_bench(fake_dask_client, bench_site1, capsys):
+def test_run_bench(fake_dask_client, load_site, capsys):
     dask_client = fake_dask_client
     params = BenchLoadParams(
         scenario="test1",
@@ -204,7 +208,7 @@ def test_run_bench(fake_dask_client, bench_site1, capsys):
         chunks=(2048, 2048),
         extra={"odc-stac": {"groupby": "solar_day", "stac_cfg": CFG}},
     )
-    xx = load_from_json(bench_site1, params)
+    xx = load_site("site1", params)
 
     rr, timing = run_bench(xx, dask_client, 10)
 
@@ -215,6 +219,21 @@ def test_run_bench(fake_dask_client, bench_site1, capsys):
     assert len(_io.out) > 0
 
 
+def test_load_from_json_mapping(bench_site1, load_site):
+    params = BenchLoadParams(
+        scenario="test1",
+        method="odc-stac",
+        bands=("red", "green", "blue"),
+        chunks=(2048, 2048),
+        extra={"odc-stac": {"groupby": "solar_day", "stac_cfg": CFG}},
+    )
+    # any read-only mapping FeatureCollection, not just dict
+    xx = load_from_json(MappingProxyType(bench_site1), params)
+    yy = load_site("site1", params)
+    assert xx.red.shape == yy.red.shape
+    assert xx.odc.geobox == yy.odc.geobox
+
+
 def test_bench_params_json():
     params = BenchLoadParams(
         scenario="test1",
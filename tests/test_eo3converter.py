@@ -42,10 +42,10 @@ def test_infer_product_collection(
     b2g = md.band2grid
     assert b2g["B02"] == "default"
     assert b2g["B01"] == "g60"
-    assert set(b2g.values()) == set("default g20 g60".split(" "))
+    assert set(b2g.values()) == {"default", "g20", "g60"}
 
     # Check that we can use product derived this way on an Item
-    item = sentinel_stac_ms_with_raster_ext.clone()
+    item = sentinel_stac_ms_with_raster_ext
 
     ds = _item_to_ds(item, product)
     geobox = native_geobox(ds, basis="B02")
@@ -92,7 +92,7 @@ def test_infer_product_item(sentinel_stac_ms: pystac.item.Item):
 
 
 def test_infer_product_raster_ext(sentinel_stac_ms_with_raster_ext: pystac.item.Item):
-    item = sentinel_stac_ms_with_raster_ext.clone()
+    item = sentinel_stac_ms_with_raster_ext
     assert has_raster_ext(item) is True
     product = infer_dc_product(item)
 
@@ -113,7 +113,7 @@ def test_infer_product_raster_ext(sentinel_stac_ms_with_raster_ext: pystac.item.
 
 def test_item_to_ds(sentinel_stac_ms: pystac.item.Item):
     item0 = sentinel_stac_ms
-    item = item0.clone()
+    item = item0
 
     assert item.collection_id in STAC_CFG
 
@@ -148,8 +148,9 @@ def test_item_to_ds(sentinel_stac_ms: pystac.item.Item):
 
     # Test multiple CRS path
     item = item0.clone()
-    ProjectionExtension.ext(item.assets["B01"]).epsg = 3857
-    assert ProjectionExtension.ext(item.assets["B01"]).crs_string == "EPSG:3857"
+    b01_proj = ProjectionExtension.ext(item.assets["B01"])
+    b01_proj.epsg = 3857
+    assert b01_proj.crs_string == "EPSG:3857"
     infer_dc_product(item, NO_WARN_CFG)
 
 
@@ -1,22 +1,34 @@
-from unittest.mock import MagicMock
-
 import pystac
 import pystac.item
 import pytest
 import shapely.geometry
-from dask.utils import ndeepmap
 from odc.geo.geobox import GeoBox
 from odc.geo.xr import ODCExtension
 
 from odc.stac import RasterLoadParams
 from odc.stac import load as stac_load
+from odc.stac import output_geobox, parse_item
 from odc.stac._stac_load import _group_items
 from odc.stac.loader import resolve_load_cfg
 from odc.stac.testing.stac import b_, mk_parsed_item, to_stac_item
 
 
+class _PatchURL:
+    """Replace every url with a fixed one, counting calls."""
+
+    __slots__ = ("url", "n")
+
+    def __init__(self, url: str):
+        self.url = url
+        self.n = 0
+
+    def __call__(self, url: str) -> str:
+        self.n += 1
+        return self.url
+
+
 def test_stac_load_smoketest(sentinel_stac_ms_with_raster_ext: pystac.item.Item):
-    item = sentinel_stac_ms_with_raster_ext.clone()
+    item = sentinel_stac_ms_with_raster_ext
 
     params = dict(crs="EPSG:3857", resolution=100, align=0, chunks={})
     xx = stac_load([item], "B02", **params)
@@ -35,7 +47,7 @@ def test_stac_load_smoketest(sentinel_stac_ms_with_raster_ext: pystac.item.Item)
     assert xx.red.shape == xx.green.shape
 
     # Test dc.load name for bands, and alias support
-    patch_url = MagicMock(return_value="https://example.com/f.tif")
+    patch_url = _PatchURL("https://example.com/f.tif")
     xx = stac_load(
         [item],
         measurements=["red", "green"],
@@ -45,16 +57,16 @@ def test_stac_load_smoketest(sentinel_stac_ms_with_raster_ext: pystac.item.Item)
     assert isinstance(xx.odc, ODCExtension)
 
     # expect patch_url to be called 2 times, 1 for red and 1 for green band
-    assert patch_url.call_count == 2
+    assert patch_url.n == 2
 
-    patch_url = MagicMock(return_value="https://example.com/f.tif")
+    patch_url = _PatchURL("https://example.com/f.tif")
     zz = stac_load(
         [item],
         patch_url=patch_url,
         stac_cfg={"*": {"warnings": "ignore"}},
         **params,
     )
-    assert patch_url.call_count == len(zz.data_vars)
+    assert patch_url.n == len(zz.data_vars)
 
     yy = stac_load(
         [item], ["nir"], like=xx, chunks={}, stac_cfg={"*": {"warnings": "ignore"}}
@@ -72,14 +84,12 @@ def test_stac_load_smoketest(sentinel_stac_ms_with_raster_ext: pystac.item.Item)
     assert yy.odc.geobox == yy.nir.odc.geobox
 
     # Check automatic CRS/resolution
-    yy = stac_load(
-        [item],
-        ["nir", "coastal"],
-        chunks={},
-        stac_cfg={"*": {"warnings": "ignore"}},
+    gbox = output_geobox(
+        [parse_item(item, {"*": {"warnings": "ignore"}})], ["nir", "coastal"]
     )
-    assert yy.odc.geobox.crs == "EPSG:32606"
-    assert yy.odc.geobox.resolution.yx == (-10, 10)
+    assert gbox is not None
+    assert gbox.crs == "EPSG:32606"
+    assert gbox.resolution.yx == (-10, 10)
 
     # test bbox overlaping with lon/lat
     with pytest.raises(ValueError):
@@ -96,116 +106,117 @@ def test_stac_load_smoketest(sentinel_stac_ms_with_raster_ext: pystac.item.Item)
             chunks={},
         )
 
-    bbox = (0, 0, 1, 1)
-    x1, y1, x2, y2 = bbox
 
-    assert (
-        stac_load(
-            [item],
-            ["nir"],
-            crs="epsg:3857",
-            resolution=10,
-            chunks={},
-            lon=(x1, x2),
-            lat=(y1, y2),
-        ).nir.odc.geobox
-        == stac_load(
-            [item],
-            ["nir"],
-            crs="epsg:3857",
-            resolution=10,
-            chunks={},
-            bbox=bbox,
-        ).nir.odc.geobox
+@pytest.fixture(scope="module")
+def lonlat_geobox(sentinel_stac_ms_with_raster_ext: pystac.item.Item) -> GeoBox:
+    # reference geobox, no need to build a whole Dataset for it
+    parsed = parse_item(sentinel_stac_ms_with_raster_ext)
+    gbox = output_geobox(
+        [parsed],
+        ["nir"],
+        crs="epsg:3857",
+        resolution=10,
+        lon=(0, 1),
+        lat=(0, 1),
     )
-
-    geopolygon = shapely.geometry.box(*bbox)
-    assert (
-        stac_load(
-            [item],
-            ["nir"],
-            crs="epsg:3857",
-            resolution=10,
-            chunks={},
-            lon=(x1, x2),
-            lat=(y1, y2),
-        ).nir.odc.geobox
-        == stac_load(
-            [item],
-            ["nir"],
-            crs="epsg:3857",
-            resolution=10,
-            chunks={},
-            geopolygon=geopolygon,
-        ).nir.odc.geobox
+    assert gbox is not None
+    return gbox
+
+
+@pytest.mark.parametrize(
+    "spatial",
+    [
+        {"bbox": (0, 0, 1, 1)},
+        {"geopolygon": shapely.geometry.box(0, 0, 1, 1)},
+    ],
+)
+def test_stac_load_spatial(
+    sentinel_stac_ms_with_raster_ext: pystac.item.Item,
+    lonlat_geobox: GeoBox,
+    spatial,
+):
+    yy = stac_load(
+        [sentinel_stac_ms_with_raster_ext],
+        ["nir"],
+        crs="epsg:3857",
+        resolution=10,
+        chunks={},
+        **spatial,
     )
+    assert yy.nir.odc.geobox == lonlat_geobox
 
 
-def test_group_items():
+@pytest.fixture(scope="module")
+def group_test_items():
+    """Parsed items and their STAC versions, built once for grouping tests."""
+
     def _mk(id: str, lon: float, datetime: str):
         gbox = GeoBox.from_bbox((lon - 0.1, 0, lon + 0.1, 1), shape=(100, 100))
-        return mk_parsed_item([b_("b1", gbox)], datetime=datetime, id=id)
+        item = mk_parsed_item([b_("b1", gbox)], datetime=datetime, id=id)
+        return item, to_stac_item(item)
+
+    return {
+        "a": _mk("a", 15 * 10, "2020-01-02T23:59Z"),
+        "b1": _mk("b1", 15 * 10 + 1, "2020-01-03T00:01Z"),
+        "b2": _mk("b2", 15 * 10 + 2, "2020-01-03T00:01Z"),
+        "c": _mk("c", 0, "2020-01-02T23:59Z"),
+    }
 
-    # check no-op case first
+
+def test_group_items_empty():
     assert _group_items([], [], "time") == []
     assert _group_items([], [], "id") == []
     assert _group_items([], [], "solar_day") == []
 
-    aa = _mk("a", 15 * 10, "2020-01-02T23:59Z")
-    b1 = _mk("b1", 15 * 10 + 1, "2020-01-03T00:01Z")
-    b2 = _mk("b2", 15 * 10 + 2, "2020-01-03T00:01Z")
-    cc = _mk("c", 0, "2020-01-02T23:59Z")
-
-    def _t(items, groupby, expect, lon=None, preserve_original_order=False):
-        stac_items = [to_stac_item(item) for item in items]
-        rr = ndeepmap(
-            2,
-            lambda idx: items[idx],
-            _group_items(
-                stac_items,
-                items,
-                groupby,
-                lon=lon,
-                preserve_original_order=preserve_original_order,
-            ),
-        )
-        _expect = ndeepmap(2, lambda item: item.id, expect)
-        _got = ndeepmap(2, lambda item: item.id, rr)
-
-        assert _expect == _got
-
-    # same order as input
-    _t([aa, b1, b2], "id", [[aa], [b1], [b2]])
-    _t([aa, b2, b1], "id", [[aa], [b2], [b1]])
-    _t([b1, aa, b2], "id", [[b1], [aa], [b2]])
-    _t([cc, aa, b1, b2], "id", [[cc], [aa], [b1], [b2]])
-
-    _t([aa, b1, b2], "time", [[aa], [b1, b2]])
-    _t([b1, aa, b2], "time", [[aa], [b1, b2]])
-
-    # order within group is preserved
-    _t([b2, aa, b1], "time", [[aa], [b2, b1]], preserve_original_order=True)
-    _t([aa, cc, b1, b2], "time", [[aa, cc], [b1, b2]], preserve_original_order=True)
-
-    _t([aa, b1, b2], "solar_day", [[aa, b1, b2]])
-    _t([b1, aa, b2], "solar_day", [[aa, b1, b2]])
-    _t([b2, aa, b1], "solar_day", [[aa, b1, b2]])
-    _t([aa, b1, b2, cc], "solar_day", [[cc], [aa, b1, b2]])
-
-    _t([aa, b1, b2, cc], "solar_day", [[aa, cc, b1, b2]], lon=150 + 1)
-
-    # property based
-    _t([aa, b1], "proj:epsg", [[aa, b1]])
-    _t([b1, aa], "proj:epsg", [[aa, b1]])
-    _t([aa, b1], "proj:transform", [[aa], [b1]])
-
-    # custom callback
-    _t(
-        [aa, b1, b2, cc],
-        lambda item, parsed, idx: idx % 2,
-        [[aa, b2], [b1, cc]],
-        preserve_original_order=True,
-    )
+
+@pytest.mark.parametrize(
+    "ids, groupby, expect, kw",
+    [
+        # same order as input
+        ("a b1 b2", "id", [["a"], ["b1"], ["b2"]], {}),
+        ("a b2 b1", "id", [["a"], ["b2"], ["b1"]], {}),
+        ("b1 a b2", "id", [["b1"], ["a"], ["b2"]], {}),
+        ("c a b1 b2", "id", [["c"], ["a"], ["b1"], ["b2"]], {}),
+        ("a b1 b2", "time", [["a"], ["b1", "b2"]], {}),
+        ("b1 a b2", "time", [["a"], ["b1", "b2"]], {}),
+        # order within group is preserved
+        (
+            "b2 a b1",
+            "time",
+            [["a"], ["b2", "b1"]],
+            {"preserve_original_order": True},
+        ),
+        (
+            "a c b1 b2",
+            "time",
+            [["a", "c"], ["b1", "b2"]],
+            {"preserve_original_order": True},
+        ),
+        ("a b1 b2", "solar_day", [["a", "b1", "b2"]], {}),
+        ("b1 a b2", "solar_day", [["a", "b1", "b2"]], {}),
+        ("b2 a b1", "solar_day", [["a", "b1", "b2"]], {}),
+        ("a b1 b2 c", "solar_day", [["c"], ["a", "b1", "b2"]], {}),
+        ("a b1 b2 c", "solar_day", [["a", "c", "b1", "b2"]], {"lon": 150 + 1}),
+        # property based
+        ("a b1", "proj:epsg", [["a", "b1"]], {}),
+        ("b1 a", "proj:epsg", [["a", "b1"]], {}),
+        ("a b1", "proj:transform", [["a"], ["b1"]], {}),
+        # custom callback
+        (
+            "a b1 b2 c",
+            lambda item, parsed, idx: idx % 2,
+            [["a", "b2"], ["b1", "c"]],
+            {"preserve_original_order": True},
+        ),
+    ],
+)
+def test_group_items(group_test_items, ids, groupby, expect, kw):
+    ids = ids.split(" ")
+    items = [group_test_items[n][0] for n in ids]
+    stac_items = [group_test_items[n][1] for n in ids]
+
+    rr = _group_items(stac_items, items, groupby, **kw)
+    assert [[ids[idx] for idx in group] for group in rr] == expect
 
 
 def test_resolve_load_cfg():
@@ -1,3 +1,6 @@
+import datetime as dt
+
+import geopandas as gpd
 import pystac
 import pystac.asset
 import pystac.collection
@@ -29,13 +32,20 @@ from odc.stac._mdtools import (
     parse_items,
 )
 from odc.stac.model import ParsedItem
-from odc.stac.testing.stac import b_, mk_parsed_item, to_stac_item
+from odc.stac.testing.stac import (
+    STAC_DATE_FMT,
+    _fmt_stac_date,
+    _norm_dates,
+    b_,
+    mk_parsed_item,
+    to_stac_item,
+)
 
 GBOX = GeoBox.from_bbox((-20, -10, 20, 10), "epsg:3857", shape=(200, 400))
 
 
 def test_is_raster_data(sentinel_stac_ms: pystac.item.Item):
-    item = sentinel_stac_ms
+    item = sentinel_stac_ms.clone()
     assert "B01" in item.assets
     assert "B02" in item.assets
 
@@ -59,7 +69,7 @@ def test_eo3_grids(sentinel_stac_ms: pystac.item.Item):
     }
 
     grids, b2g = compute_eo3_grids(data_bands)
-    assert set(grids) == set("default g20 g60".split(" "))
+    assert set(grids) == {"default", "g20", "g60"}
     assert set(grids) == set(b2g.values())
     assert set(b2g) == set(data_bands)
 
@@ -71,8 +81,9 @@ def test_eo3_grids(sentinel_stac_ms: pystac.item.Item):
 
     # More than 1 CRS should work
     item = item0.clone()
-    ProjectionExtension.ext(item.assets["B01"]).epsg = 3857
-    assert ProjectionExtension.ext(item.assets["B01"]).epsg == 3857
+    b01_proj = ProjectionExtension.ext(item.assets["B01"])
+    b01_proj.epsg = 3857
+    assert b01_proj.epsg == 3857
 
     data_bands = {k: item.assets[k] for k in data_bands}
     grids, b2g = compute_eo3_grids(data_bands)
@@ -83,7 +94,7 @@ def test_eo3_grids(sentinel_stac_ms: pystac.item.Item):
 
 def test_asset_geobox(sentinel_stac: pystac.item.Item):
     item0 = sentinel_stac
-    item = item0.clone()
+    item = item0
     asset = item.assets["B01"]
     geobox = asset_geobox(asset)
     assert geobox.shape == (1830, 1830)
@@ -162,7 +173,7 @@ def test_is_raster_data_more():
 
 def test_extract_md(sentinel_stac_ms: pystac.item.Item):
     item0 = sentinel_stac_ms
-    item = pystac.Item.from_dict(item0.to_dict())
+    item = item0
 
     assert item.collection_id in STAC_CFG
 
@@ -197,14 +208,15 @@ def test_extract_md(sentinel_stac_ms: pystac.item.Item):
         assert band.unit == "1"
 
     # Test that multiple CRSs per item work
-    item = pystac.Item.from_dict(item0.to_dict())
-    ProjectionExtension.ext(item.assets["B01"]).epsg = 3857
-    assert ProjectionExtension.ext(item.assets["B01"]).crs_string == "EPSG:3857"
+    item = item0.clone()
+    b01_proj = ProjectionExtension.ext(item.assets["B01"])
+    b01_proj.epsg = 3857
+    assert b01_proj.crs_string == "EPSG:3857"
     md = extract_collection_metadata(item, NO_WARN_CFG)
     assert md.band2grid["B01"] != md.band2grid["B02"]
 
     # Test no-collection name item
-    item = pystac.Item.from_dict(item0.to_dict())
+    item = item0.clone()
     item.collection_id = None
     md = extract_collection_metadata(item, NO_WARN_CFG)
     assert md.name == "_"
@@ -225,9 +237,9 @@ def test_extract_md_raster_ext(sentinel_stac_ms_with_raster_ext: pystac.item.Ite
     assert md.aliases["blue"] == [("B02", 1), ("visual", 3)]
 
 
-def test_parse_item(sentinel_stac_ms: pystac.item.Item):
+def test_parse_item(sentinel_stac_ms: pystac.item.Item, parsed_item_s2: ParsedItem):
     item0 = sentinel_stac_ms
-    item = pystac.Item.from_dict(item0.to_dict())
+    item = item0
 
     md = extract_collection_metadata(item, STAC_CFG)
 
@@ -246,23 +258,23 @@ def test_parse_item(sentinel_stac_ms: pystac.item.Item):
     assert xx["B02"] is xx["B02.1"]
     assert xx.get("B02", None) is xx["B02.1"]
 
-    assert xx.geoboxes() == xx.geoboxes(S2_ALL_BANDS)
+    all_gbx = xx.geoboxes()
+    assert all_gbx == xx.geoboxes(S2_ALL_BANDS)
     assert xx.geoboxes(["B02", "B03"]) == (xx["B02"].geobox,)
     assert xx.geoboxes(["B01", "B02", "B03"]) == (
         xx["B02"].geobox,
         xx["B01"].geobox,
     )
-    assert xx.geoboxes() == (
+    assert all_gbx == (
         xx["B02"].geobox,  # 10m
         xx["B05"].geobox,  # 20m
         xx["B01"].geobox,  # 60m
     )
 
-    (yy,) = list(parse_items(iter([item]), STAC_CFG))
-    assert xx == yy
+    assert xx == parsed_item_s2
 
     # Test missing band case
-    item = pystac.Item.from_dict(item0.to_dict())
+    item = item0.clone()
     item.assets.pop("B01")
     xx = parse_item(item, md)
     assert "B01" not in xx
@@ -297,7 +309,7 @@ def test_parse_no_absolute_href(relative_href_only: pystac.item.Item):
 
 def test_parse_item_no_proj(sentinel_stac_ms: pystac.item.Item):
     item0 = sentinel_stac_ms
-    item = pystac.Item.from_dict(item0.to_dict())
+    item = item0.clone()
     item.stac_extensions.remove(ProjectionExtension.get_schema_uri())
     assert has_proj_ext(item) is False
 
@@ -312,7 +324,8 @@ def test_parse_item_no_proj(sentinel_stac_ms: pystac.item.Item):
     assert _auto_load_params([xx] * 3) is None
 
 
-@pytest.fixture
+# read-only, parsed once for all tests in the module
+@pytest.fixture(scope="module")
 def parsed_item_s2(sentinel_stac_ms: pystac.item.Item):
     (item,) = parse_items([sentinel_stac_ms], STAC_CFG)
     yield item
@@ -335,21 +348,22 @@ def test_auto_load_params(parsed_item_s2: ParsedItem):
     assert _20m.xy == (20, -20)
     assert _60m.xy == (60, -60)
 
+    xx3 = [xx] * 3
     assert _auto_load_params([]) is None
     assert _auto_load_params([xx]) == (crs, _10m, _edge, _gbox_10m)
-    assert _auto_load_params([xx] * 3) == (crs, _10m, _edge, _gbox_10m)
+    assert _auto_load_params(xx3) == (crs, _10m, _edge, _gbox_10m)
 
     assert _auto_load_params([xx], ["B01"]) == (crs, _60m, _edge, _gbox_60m)
-    assert _auto_load_params([xx] * 3, ["B01", "B05", "B06"]) == (
+    assert _auto_load_params(xx3, ["B01", "B05", "B06"]) == (
         crs,
         _20m,
         _edge,
         _gbox_20m,
     )
-    assert _auto_load_params([xx] * 3, ["B01", "B04"]) == (crs, _10m, _edge, _gbox_10m)
+    assert _auto_load_params(xx3, ["B01", "B04"]) == (crs, _10m, _edge, _gbox_10m)
 
 
-def test_norm_geom(gpd_iso3):
+def test_norm_geom(gpd_country):
     g = geom.box(0, -1, 10, 1, "epsg:4326")
 
     assert _normalize_geometry(g) is g
@@ -361,14 +375,21 @@ def test_norm_geom(gpd_iso3):
         _normalize_geometry(dict(type="FeatureCollection", features=[g.geojson()])) == g
     )
 
-    g = gpd_iso3("AUS")
+    g = gpd_country("AUS")
     assert g.crs == "epsg:4326"
     assert _normalize_geometry(g).crs == "epsg:4326"
 
-    g = gpd_iso3("AUS", "epsg:3577")
+    g = gpd_country("AUS", "epsg:3577")
     assert g.crs == "epsg:3577"
     assert _normalize_geometry(g).crs == "epsg:3577"
 
+    # multiple rows, same as going through GeoJSON
+    gg = gpd.GeoSeries(
+        [g.geometry.iloc[0], geom.box(0, 0, 1, 1, g.crs).geom], crs=g.crs
+    )
+    assert _normalize_geometry(gg) == geom.Geometry(gg.__geo_interface__, g.crs)
+    assert _normalize_geometry(gg).geom_type == "MultiPolygon"
+
     with pytest.raises(ValueError):
         _ = _normalize_geometry({})  # not a valid geojson
 
@@ -376,8 +397,8 @@ def test_norm_geom(gpd_iso3):
         _ = _normalize_geometry(object())  # Can't interpret value as geometry
 
 
-def test_output_geobox(gpd_iso3, parsed_item_s2: ParsedItem):
-    au = gpd_iso3("AUS", "epsg:3577")
+def test_output_geobox(gpd_country, parsed_item_s2: ParsedItem):
+    au = gpd_country("AUS", "epsg:3577")
 
     gbox = output_geobox([], geopolygon=au, resolution=100, crs="epsg:3857")
     assert gbox is not None
@@ -527,7 +548,7 @@ def test_mk_parsed_item():
     assert item.datetime_range[0].strftime(fmt) == "2020-01-01"
     assert item.datetime_range[1] is None
 
-    gbox = GeoBox.from_bbox((-20, -10, 20, 10), "epsg:3857", shape=(200, 400))
+    gbox = GBOX
     item = mk_parsed_item(
         [b_("b1", geobox=gbox), b_("b2", geobox=gbox)],
         "2020-01-10",
@@ -536,35 +557,90 @@ def test_mk_parsed_item():
     assert item.geometry.crs == "epsg:4326"
     assert item.crs() == "epsg:3857"
     assert item.geoboxes() == (gbox,)
+    assert item.geoboxes() is item.geoboxes()
+    assert item.image_geometry() == gbox.extent
+    assert item.image_geometry("epsg:4326") is item.image_geometry("epsg:4326")
+    assert item.image_geometry("epsg:4326").crs == "epsg:4326"
     assert item.collection.has_proj is True
 
 
-@pytest.mark.parametrize(
-    "parsed_item",
-    [
-        mk_parsed_item(
-            [b_("band")], None, "2020-01-01", "2021-12-31T23:59:59.9999999Z"
-        ),
-        mk_parsed_item([b_("b1"), b_("b2", nodata=10)], "2020-01-01"),
-        mk_parsed_item(
-            [
-                b_("b1", dtype="float32", geobox=GBOX),
-                b_("b2", nodata=10, geobox=GBOX),
-            ],
-            "2020-01-01",
-        ),
-        mk_parsed_item(
-            [
-                b_("b1", dtype="float32", geobox=GBOX),
-                b_("b2", dtype="int32", nodata=-99, geobox=GBOX.zoom_out(2)),
-            ],
-            "2020-01-01",
-            "2020-01-01",
-            "2021-12-31T23:59:59.9999999Z",
-            href="file:///date/item/1.json",
-        ),
-    ],
-)
+def test_norm_dates():
+    utc = dt.timezone.utc
+    assert _norm_dates() == []
+    assert _norm_dates(None, "") == [None, None]
+    assert _norm_dates("2020-01-02", "2020-01-02T23:59Z") == [
+        dt.datetime(2020, 1, 2, tzinfo=utc),
+        dt.datetime(2020, 1, 2, 23, 59, tzinfo=utc),
+    ]
+    assert _norm_dates(
+        "2021-12-31T23:59:59.9999999Z", "2020-01-01T10:00:00.5+10:00"
+    ) == [
+        dt.datetime(2021, 12, 31, 23, 59, 59, 999999, tzinfo=utc),
+        dt.datetime(2020, 1, 1, 0, 0, 0, 500000, tzinfo=utc),
+    ]
+    for t in _norm_dates("2021-12-31T23:59:59.123Z", "2020-01-02"):
+        assert _fmt_stac_date(t) == t.strftime(STAC_DATE_FMT)
+
+    assert _norm_dates(dt.datetime(2020, 1, 1)) == [dt.datetime(2020, 1, 1, tzinfo=utc)]
+
+
+def test_b_():
+    (bk1, b1), (bk2, b2) = b_("a.2"), b_("b", dtype="int16", nodata=None)
+    assert bk1 == ("a", 2)
+    assert bk2 == ("b", 1)
+    assert b1.meta is b2.meta
+    assert b_("c", nodata=-1)[1].meta.nodata == -1
+
+
+def test_parsed_item_geoboxes():
+    g10 = GBOX
+    g20 = GBOX.zoom_out(2)
+    g20_copy = GeoBox(g20.shape, g20.affine, g20.crs)
+    assert g20_copy is not g20 and g20_copy == g20
+
+    def _gbx(*gboxes):
+        bands = [b_(f"b{i}", geobox=g) for i, g in enumerate(gboxes)]
+        return mk_parsed_item(bands, "2020-01-01").geoboxes()
+
+    assert _gbx(g10) == (g10,)
+    assert _gbx(g10, g20) == (g10, g20)
+    assert _gbx(g20, g10) == (g10, g20)
+    assert _gbx(g20, g20_copy) == (g20,)
+    assert _gbx(g20, g20_copy, g10) == (g10, g20)
+
+
+# built lazily, only for the selected test ids
+_ROUND_TRIP_ITEMS = {
+    "one-band-range": lambda: mk_parsed_item(
+        [b_("band")], None, "2020-01-01", "2021-12-31T23:59:59.9999999Z"
+    ),
+    "no-geo": lambda: mk_parsed_item([b_("b1"), b_("b2", nodata=10)], "2020-01-01"),
+    "one-grid": lambda: mk_parsed_item(
+        [
+            b_("b1", dtype="float32", geobox=GBOX),
+            b_("b2", nodata=10, geobox=GBOX),
+        ],
+        "2020-01-01",
+    ),
+    "two-grids-href": lambda: mk_parsed_item(
+        [
+            b_("b1", dtype="float32", geobox=GBOX),
+            b_("b2", dtype="int32", nodata=-99, geobox=GBOX.zoom_out(2)),
+        ],
+        "2020-01-01",
+        "2020-01-01",
+        "2021-12-31T23:59:59.9999999Z",
+        href="file:///date/item/1.json",
+    ),
+}
+
+
+@pytest.fixture
+def parsed_item(request) -> ParsedItem:
+    return _ROUND_TRIP_ITEMS[request.param]()
+
+
+@pytest.mark.parametrize("parsed_item", list(_ROUND_TRIP_ITEMS), indirect=True)
 def test_round_trip(parsed_item: ParsedItem):
     item = to_stac_item(parsed_item)
     md = extract_collection_metadata(item)
@@ -1,4 +1,5 @@
 import datetime as dt
+import pickle
 
 import pytest
 from dask.base import tokenize
@@ -11,6 +12,7 @@ from odc.stac import (
     RasterLoadParams,
     RasterSource,
 )
+from odc.stac.loader.types import BAND_DEFAULTS, norm_band_metadata
 from odc.stac.testing.stac import b_, mk_parsed_item
 
 
@@ -27,6 +29,26 @@ def test_band_load_info():
     assert RasterLoadParams(resampling="average").nearest is False
 
 
+def test_norm_band_metadata():
+    meta = RasterBandMetadata("uint8", 0, "1")
+    assert norm_band_metadata(meta) is meta
+    assert norm_band_metadata({}) is BAND_DEFAULTS
+    assert norm_band_metadata({}, meta) is meta
+
+    cfg = {"data_type": "int16", "nodata": -1}
+    assert norm_band_metadata(cfg) == RasterBandMetadata("int16", -1, "1")
+    assert norm_band_metadata(cfg) is norm_band_metadata(dict(cfg))
+    assert norm_band_metadata(cfg, meta) == RasterBandMetadata("int16", -1, "1")
+    assert norm_band_metadata({"unit": "m"}, meta) == RasterBandMetadata(
+        "uint8", 0, "m"
+    )
+
+    # int/float nodata must not share cached instances
+    assert type(norm_band_metadata({"nodata": 0}).nodata) is int
+    assert type(norm_band_metadata({"nodata": 0.0}).nodata) is float
+    assert type(norm_band_metadata({"nodata": 0}).nodata) is int
+
+
 @pytest.mark.parametrize("lon", [0, -179, 179, 10, 23.4])
 def test_mid_longitude(lon: float):
     gbox = GeoBox.from_bbox((lon - 0.1, 0, lon + 0.1, 1), shape=(100, 100))
@@ -55,6 +77,7 @@ def test_solar_day():
 
     xx = _mk(-15.1, "2020-01-02T12:13:14Z")
     assert xx.nominal_datetime != xx.solar_date
+    assert xx.solar_date is xx.solar_date
     assert xx.nominal_datetime - dt.timedelta(seconds=3600) == xx.solar_date
     assert xx.nominal_datetime - dt.timedelta(seconds=3600) == xx.solar_date_at(-20)
 
@@ -111,6 +134,8 @@ def test_collection(collection_ab: RasterCollectionMetadata):
     assert {} not in xx
     assert ("some-random", 1) not in xx
     assert "no-such-band" not in xx
+    assert "b.x" not in xx
+    assert "b.2" not in xx
 
     assert xx.resolve_bands("AA")["AA"] == xx["a"]
     assert list(xx.resolve_bands(["a", "B"])) == ["a", "B"]
@@ -129,6 +154,13 @@ def test_collection(collection_ab: RasterCollectionMetadata):
     with pytest.raises(ValueError):
         _ = xx.resolve_bands(["xxxxxxxx", "a"])
 
+    assert xx.band_aliases() == {("a", 1): ["A", "AA"], ("b", 1): ["B"]}
+    # result is cached internally, but callers get their own copy
+    aa = xx.band_aliases()
+    aa[("a", 1)].append("zz")
+    assert xx.band_aliases() == {("a", 1): ["A", "AA"], ("b", 1): ["B"]}
+    assert xx.band_aliases(unique=True) == xx.band_aliases()
+
 
 def test_collection_allbands():
     xx = mk_parsed_item([b_("a.1"), b_("a.2"), b_("a.3")])
@@ -149,6 +181,41 @@ def test_collection_allbands():
     assert md.canonical_name("AAA") == "AAA"
 
 
+def test_collection_inplace_edits():
+    xx = mk_parsed_item([b_("a.1"), b_("a.2")])
+    md = xx.collection
+    assert md.all_bands == ["a.1", "a.2"]
+
+    md.aliases["AA"] = [("a", 2)]
+    md.bands[("c", 1)] = md.bands[("a", 1)]
+    assert "c" in md
+    assert md["c"] is md.bands[("c", 1)]
+    assert md["AA"] is md.bands[("a", 2)]
+    assert md.all_bands == ["a.1", "AA", "c"]
+    assert md.canonical_name("a.2") == "AA"
+    assert md.band_aliases() == {("a", 2): ["AA"]}
+
+    # same number of aliases, different target
+    md.aliases["AA"] = [("c", 1)]
+    assert md.band_key("AA") == ("c", 1)
+    assert md.band_aliases() == {("c", 1): ["AA"]}
+    assert md.all_bands == ["a.1", "a.2", "c"]
+
+    # asset.N forms
+    assert "a.01" in md
+    assert md.band_key("a.01") == ("a", 1)
+    assert "a.x" not in md
+    assert "b" not in md
+
+
+def test_parsed_item_assets():
+    xx = mk_parsed_item([b_("a.3"), b_("b"), b_("a.1"), b_("a.2")])
+    assets = xx.assets()
+    assert list(assets) == ["a", "b"]
+    assert assets["a"] == [xx.bands[("a", i)] for i in (1, 2, 3)]
+    assert assets["b"] == [xx.bands[("b", 1)]]
+
+
 def test_parsed_item(parsed_item_ab: ParsedItem):
     xx = parsed_item_ab
     assert xx["AA"] is not None
@@ -187,6 +254,19 @@ def test_parsed_item(parsed_item_ab: ParsedItem):
     assert xx.strip()["b"].subdataset == xx["b"].subdataset
 
 
+def test_pickle(parsed_item_ab: ParsedItem):
+    xx = parsed_item_ab
+    assert xx.geoboxes() == ()
+    assert xx.collection.all_bands == ["a", "b"]
+
+    yy = pickle.loads(pickle.dumps(xx))
+    assert yy == xx
+    assert hash(yy) == hash(xx)
+    assert yy.collection == xx.collection
+    assert yy.collection.all_bands == ["a", "b"]
+    assert yy["AA"] == xx["AA"]
+
+
 def test_tokenize(parsed_item_ab: ParsedItem):
     assert tokenize(parsed_item_ab.collection) == tokenize(parsed_item_ab.collection)
     assert tokenize(parsed_item_ab) == tokenize(parsed_item_ab)